@@ -12,9 +12,12 @@
 #   - This lets cli.py be imported by tests without triggering execution
 # =============================================================================
 
-from example_cli.cli import main
-
 # Only runs when executed as a module (python -m example_cli)
 # Does NOT run when imported (import example_cli)
+#
+# The import lives inside the guard so that merely importing this module
+# (tests, wheel introspection tools) doesn't pull in Click.
 if __name__ == "__main__":
+    from example_cli.cli import main
+
     main()
@@ -18,49 +18,98 @@
 #   @click.argument("name") adds a required positional argument.
 #   @click.option("--loud") adds an optional flag.
 #   Click automatically generates --help from docstrings and decorators.
+#
+# Lazy subcommands:
+#   Each subcommand lives in its own module (cli_greet.py, cli_info.py) and
+#   is only imported when that command runs. Click's stock --help resolves
+#   every subcommand just to print its one-line help, so LazyGroup keeps
+#   those lines next to the module paths and renders --help from them —
+#   `example-cli --help` imports no subcommand, config, or core module.
+#   Rich is later still: only greet's terminal output path loads it.
+#   For a tiny CLI, import time IS the startup time.
 # =============================================================================
 
+import functools
+import importlib
+from typing import TYPE_CHECKING
+
 import click
-from rich.console import Console
 
-from example_cli.config import load_config
-from example_cli.core import build_greeting
+if TYPE_CHECKING:
+    from rich.console import Console
 
-# Rich console for pretty terminal output (colors, formatting)
-console = Console()
 
+@functools.lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Return the shared Rich console, importing Rich on first use.
 
-@click.group()
-@click.version_option()
-def main() -> None:
-    """Example CLI tool — template for Python projects.
-
-    This is the top-level command group. Subcommands are defined below.
+    Rich pulls in its markup parser and terminal detection at import time.
+    Deferring it means `--help`, `--version`, and argument-error exits never
+    pay for it; lru_cache makes every later call return the same Console.
     """
+    from rich.console import Console
+
+    return Console()
 
 
-@main.command()
-@click.argument("name")
-@click.option("--loud", is_flag=True, help="SHOUT the greeting")
-@click.option("--count", default=1, help="Number of times to greet")
-def greet(name: str, loud: bool, count: int) -> None:
-    """Greet someone by name.
+class LazyGroup(click.Group):
+    """A Click group that imports subcommand modules on first use.
 
-    NAME is the person to greet (required).
+    `lazy_subcommands` maps a command name to a ("module.path", "attribute",
+    "short help") triple. The module is only imported when Click asks for
+    that command; the short help is what `--help` lists for it, so keep it
+    in sync with the command's docstring (test_cli.py checks this).
     """
-    # Load configuration (env vars → defaults) and build the greeting
-    config = load_config()
-    greeting = build_greeting(name, loud=loud, template=config.greeting_template)
 
-    # Print the greeting the requested number of times
-    for _ in range(count):
-        console.print(f"[bold green]{greeting}[/bold green]")
+    lazy_subcommands: dict[str, tuple[str, str, str]] = {
+        "greet": ("example_cli.cli_greet", "greet", "Greet someone by name."),
+        "info": ("example_cli.cli_info", "info", "Show project information."),
+    }
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return eager and lazy command names, sorted for --help output."""
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Resolve a command, importing its module only if it's lazy."""
+        if cmd_name not in self.lazy_subcommands:
+            return super().get_command(ctx, cmd_name)
 
+        module_name, attr_name, _ = self.lazy_subcommands[cmd_name]
+        module = importlib.import_module(module_name)
+        command: click.Command = getattr(module, attr_name)
+        return command
 
-@main.command()
-def info() -> None:
-    """Show project information."""
-    from example_cli import __version__
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """Write the --help command list without importing lazy commands.
 
-    console.print(f"[bold]example-cli[/bold] v{__version__}")
-    console.print("A template CLI project for learning Python packaging.")
+        Click's default calls get_command() for every name to read its
+        short help, which would import every subcommand module on --help.
+        """
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        # Same width budget Click's default uses for the help column
+        limit = formatter.width - 6 - max(map(len, names))
+
+        rows = []
+        for name in names:
+            if name in self.lazy_subcommands:
+                rows.append((name, self.lazy_subcommands[name][2]))
+                continue
+            cmd = super().get_command(ctx, name)
+            if cmd is not None and not cmd.hidden:
+                rows.append((name, cmd.get_short_help_str(limit)))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+@click.group(cls=LazyGroup)
+@click.version_option()
+def main() -> None:
+    """Example CLI tool — template for Python projects.
+
+    This is the top-level command group. Subcommands live in cli_*.py modules.
+    """
@@ -0,0 +1,49 @@
+# =============================================================================
+# cli_greet.py — `greet` Subcommand
+# =============================================================================
+# Loaded lazily by LazyGroup in cli.py — this module (and config.py, core.py)
+# is only imported when the user runs `example-cli greet`; the top-level
+# `--help` lists it without importing it. Rich isn't loaded by the import at
+# all: only _console() loads it, on the terminal output path below.
+# =============================================================================
+
+import os
+import sys
+
+import click
+
+from example_cli.cli import _console
+from example_cli.config import load_config
+from example_cli.core import build_greeting
+
+
+@click.command()
+@click.argument("name")
+@click.option("--loud", is_flag=True, help="SHOUT the greeting")
+@click.option("--count", default=1, help="Number of times to greet")
+def greet(name: str, loud: bool, count: int) -> None:
+    """Greet someone by name.
+
+    NAME is the person to greet (required).
+    """
+    # Load configuration (env vars → defaults) and build the greeting.
+    # load_config() is cached, so repeated invocations in one process (e.g.
+    # a test suite driving `main` through CliRunner) parse env vars once.
+    template = load_config().greeting_template
+    greeting = build_greeting(name, loud=loud, template=template)
+
+    # Nothing to print — bail out before the join below emits a blank line
+    if count < 1:
+        return
+
+    # Pick the output path once, before touching Rich: if colour is off
+    # (NO_COLOR, https://no-color.org) or stdout is a pipe/file, there's
+    # nothing for Rich to do — skip importing it and its markup parser
+    if os.environ.get("NO_COLOR") or not sys.stdout.isatty():
+        sys.stdout.write((greeting + "\n") * count)
+        return
+
+    # Build the full output once and emit it in a single call: str join runs
+    # in C, instead of `count` Python-level prints
+    styled = f"[bold green]{greeting}[/bold green]"
+    _console().print("\n".join([styled] * count))
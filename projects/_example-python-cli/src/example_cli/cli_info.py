@@ -0,0 +1,20 @@
+# =============================================================================
+# cli_info.py — `info` Subcommand
+# =============================================================================
+# Loaded lazily by LazyGroup in cli.py — only imported when the user runs
+# `example-cli info`; the top-level `--help` lists it without importing it.
+#
+# Uses click.echo/click.style rather than Rich: two short lines with one bold
+# span don't need Rich's rendering pipeline, so this command never imports it.
+# =============================================================================
+
+import click
+
+
+@click.command()
+def info() -> None:
+    """Show project information."""
+    from example_cli import __version__
+
+    click.echo(f"{click.style('example-cli', bold=True)} v{__version__}")
+    click.echo("A template CLI project for learning Python packaging.")
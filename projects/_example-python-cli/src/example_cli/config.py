@@ -17,15 +17,22 @@
 #   - Documented: each field has a comment explaining what it controls
 # =============================================================================
 
+import functools
 import os
 from dataclasses import dataclass
 
+# Values of EXAMPLE_CLI_DEBUG that count as "on" (compared lowercase).
+# A frozenset is built once at import and gives O(1) membership checks.
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
 
-@dataclass
+
+@dataclass(frozen=True)
 class Config:
     """Application configuration loaded from environment and defaults.
 
     Each field corresponds to an environment variable (uppercase, prefixed).
+    Frozen because load_config() hands out one cached instance — a caller
+    mutating it would silently change config for everyone else.
     """
 
     # Enable debug output (more verbose logging)
@@ -41,11 +48,16 @@ class Config:
     max_retries: int = 3
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> Config:
     """Load configuration from environment variables with defaults.
 
     Returns a Config instance with values from the environment where set,
     falling back to defaults for anything not specified.
+
+    The result is cached — env vars don't change mid-process, so parsing
+    them once is enough. Tests that modify os.environ should call
+    ``load_config.cache_clear()`` to force a fresh read.
     """
     # Parse max_retries safely — fall back to default on non-integer input
     try:
@@ -54,7 +66,7 @@ def load_config() -> Config:
         max_retries = Config.max_retries
 
     return Config(
-        debug=os.getenv("EXAMPLE_CLI_DEBUG", "").lower() in ("1", "true", "yes"),
+        debug=os.getenv("EXAMPLE_CLI_DEBUG", "").lower() in _TRUTHY,
         greeting_template=os.getenv("EXAMPLE_CLI_GREETING_TEMPLATE", Config.greeting_template),
         max_retries=max_retries,
     )
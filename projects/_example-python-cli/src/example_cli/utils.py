@@ -13,8 +13,15 @@
 #     it's time to split
 # =============================================================================
 
+import os
 from pathlib import Path
 
+# truncate_string defaults, hoisted so the common call (default length and
+# suffix) reuses a precomputed budget instead of recomputing len(suffix)
+_DEFAULT_MAX_LENGTH = 80
+_DEFAULT_SUFFIX = "..."
+_DEFAULT_BUDGET = _DEFAULT_MAX_LENGTH - len(_DEFAULT_SUFFIX)
+
 
 def ensure_directory(path: Path) -> Path:
     """Create a directory (and parents) if it doesn't exist.
@@ -28,11 +35,18 @@ def ensure_directory(path: Path) -> Path:
     Example:
         >>> data_dir = ensure_directory(Path("~/.my-tool/data").expanduser())
     """
+    # Fast path: a stat() is cheaper than mkdir(), which always goes down the
+    # filesystem's write path even when it ends up failing with EEXIST.
+    # Not memoized — a directory can be deleted later, so we always re-check.
+    if os.path.isdir(path):
+        return path
     path.mkdir(parents=True, exist_ok=True)
     return path
 
 
-def truncate_string(text: str, max_length: int = 80, suffix: str = "...") -> str:
+def truncate_string(
+    text: str, max_length: int = _DEFAULT_MAX_LENGTH, suffix: str = _DEFAULT_SUFFIX
+) -> str:
     """Truncate a string to a maximum length, adding a suffix if truncated.
 
     Args:
@@ -51,4 +65,8 @@ def truncate_string(text: str, max_length: int = 80, suffix: str = "...") -> str
     """
     if len(text) <= max_length:
         return text
-    return text[: max_length - len(suffix)] + suffix
+    if max_length == _DEFAULT_MAX_LENGTH and suffix is _DEFAULT_SUFFIX:
+        budget = _DEFAULT_BUDGET
+    else:
+        budget = max_length - len(suffix)
+    return text[:budget] + suffix
@@ -21,4 +21,23 @@
 #       assert sample_config.debug is True
 # =============================================================================
 
+from collections.abc import Iterator
+
+import pytest
+
+from example_cli.config import load_config
+
+
+@pytest.fixture(autouse=True)
+def _fresh_config() -> Iterator[None]:
+    """Clear load_config()'s cache around every test.
+
+    load_config() is memoized, so a test that sets env vars with monkeypatch
+    would otherwise see the Config cached by an earlier test.
+    """
+    load_config.cache_clear()
+    yield
+    load_config.cache_clear()
+
+
 # Add shared fixtures here as you write more tests.
@@ -0,0 +1,81 @@
+# =============================================================================
+# test_cli.py — Tests for the Command-Line Interface
+# =============================================================================
+# Click's CliRunner invokes commands in-process and captures their output,
+# so CLI tests run as fast as plain function calls — no subprocesses.
+# Captured output isn't a terminal, so greet takes its plain-text path.
+# =============================================================================
+
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from example_cli.cli import LazyGroup, main
+from example_cli.config import load_config
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+class TestGreet:
+    """Tests for the greet subcommand."""
+
+    def test_greets_by_name(self, runner: CliRunner) -> None:
+        result = runner.invoke(main, ["greet", "Alice"])
+        assert result.exit_code == 0
+        assert result.output == "Hello, Alice!\n"
+
+    def test_count_repeats_greeting(self, runner: CliRunner) -> None:
+        result = runner.invoke(main, ["greet", "Bob", "--count", "3", "--loud"])
+        assert result.output == "HELLO, BOB!\n" * 3
+
+    def test_uses_template_from_env(
+        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("EXAMPLE_CLI_GREETING_TEMPLATE", "Howdy, {name}!")
+        result = runner.invoke(main, ["greet", "Cy"])
+        assert result.output == "Howdy, Cy!\n"
+
+    def test_repeat_invocations_parse_config_once(self, runner: CliRunner) -> None:
+        """load_config() is cached, so a second run shouldn't re-read env vars."""
+        runner.invoke(main, ["greet", "A"])
+        runner.invoke(main, ["greet", "B"])
+        assert load_config.cache_info().misses == 1
+
+
+class TestInfo:
+    """Tests for the info subcommand."""
+
+    def test_shows_version(self, runner: CliRunner) -> None:
+        from example_cli import __version__
+
+        result = runner.invoke(main, ["info"])
+        assert result.exit_code == 0
+        assert f"example-cli v{__version__}" in result.output
+
+
+class TestHelp:
+    """Tests for the top-level --help output."""
+
+    def test_help_skips_subcommand_imports(
+        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """--help should list commands without importing their modules."""
+        lazy_modules = ("example_cli.cli_greet", "example_cli.cli_info", "example_cli.core")
+        for name in lazy_modules:
+            monkeypatch.delitem(sys.modules, name, raising=False)
+        result = runner.invoke(main, ["--help"])
+        assert result.exit_code == 0
+        assert "Greet someone by name." in result.output
+        assert not any(name in sys.modules for name in lazy_modules)
+
+    @pytest.mark.parametrize("name", sorted(LazyGroup.lazy_subcommands))
+    def test_lazy_help_matches_command(self, name: str) -> None:
+        """Each stored short help should match the command's own docstring."""
+        command = main.get_command(click.Context(main), name)
+        assert command is not None
+        assert LazyGroup.lazy_subcommands[name][2] == command.get_short_help_str()
@@ -0,0 +1,49 @@
+# =============================================================================
+# test_config.py — Tests for Configuration Loading
+# =============================================================================
+# Tests load_config() against environment variables. monkeypatch sets env
+# vars for a single test and restores them afterwards; the autouse fixture
+# in conftest.py clears load_config()'s cache so each test reads fresh.
+# =============================================================================
+
+import pytest
+
+from example_cli.config import Config, load_config
+
+
+class TestLoadConfig:
+    """Tests for the load_config function."""
+
+    def test_defaults(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """With no env vars set, should return the dataclass defaults."""
+        monkeypatch.delenv("EXAMPLE_CLI_DEBUG", raising=False)
+        monkeypatch.delenv("EXAMPLE_CLI_GREETING_TEMPLATE", raising=False)
+        monkeypatch.delenv("EXAMPLE_CLI_MAX_RETRIES", raising=False)
+        assert load_config() == Config()
+
+    def test_reads_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Env vars should override the defaults."""
+        monkeypatch.setenv("EXAMPLE_CLI_DEBUG", "true")
+        monkeypatch.setenv("EXAMPLE_CLI_MAX_RETRIES", "7")
+        config = load_config()
+        assert config.debug is True
+        assert config.max_retries == 7
+
+    @pytest.mark.parametrize("value", ["1", "true", "YES", "on"])
+    def test_debug_truthy_values(self, monkeypatch: pytest.MonkeyPatch, value: str) -> None:
+        """Any of the accepted truthy spellings should enable debug."""
+        monkeypatch.setenv("EXAMPLE_CLI_DEBUG", value)
+        assert load_config().debug is True
+
+    def test_invalid_max_retries_falls_back(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A non-integer max_retries should fall back to the default."""
+        monkeypatch.setenv("EXAMPLE_CLI_MAX_RETRIES", "lots")
+        assert load_config().max_retries == Config.max_retries
+
+    def test_result_is_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Repeat calls should return the same object until cache_clear()."""
+        first = load_config()
+        monkeypatch.setenv("EXAMPLE_CLI_DEBUG", "1")
+        assert load_config() is first
+        load_config.cache_clear()
+        assert load_config().debug is True
@@ -0,0 +1,54 @@
+# =============================================================================
+# test_utils.py — Tests for Shared Helper Functions
+# =============================================================================
+# Tests the small helpers in utils.py. Filesystem tests use pytest's built-in
+# tmp_path fixture — a fresh temporary directory per test, cleaned up for you.
+# =============================================================================
+
+from pathlib import Path
+
+from example_cli.utils import ensure_directory, truncate_string
+
+
+class TestEnsureDirectory:
+    """Tests for the ensure_directory function."""
+
+    def test_creates_nested_directories(self, tmp_path: Path) -> None:
+        """Missing parents should be created along with the target."""
+        target = tmp_path / "a" / "b" / "c"
+        assert ensure_directory(target) == target
+        assert target.is_dir()
+
+    def test_existing_directory_is_fine(self, tmp_path: Path) -> None:
+        """Calling it on an existing directory should be a no-op."""
+        assert ensure_directory(tmp_path) == tmp_path
+
+    def test_recreates_after_deletion(self, tmp_path: Path) -> None:
+        """A directory removed after a previous call should be created again."""
+        target = tmp_path / "data"
+        ensure_directory(target)
+        target.rmdir()
+        ensure_directory(target)
+        assert target.is_dir()
+
+
+class TestTruncateString:
+    """Tests for the truncate_string function."""
+
+    def test_short_string_unchanged(self) -> None:
+        """Strings within the limit should be returned as-is."""
+        assert truncate_string("Hello", max_length=10) == "Hello"
+
+    def test_truncates_with_suffix(self) -> None:
+        """Long strings should be cut so the result (with suffix) fits."""
+        assert truncate_string("Hello, World!", max_length=10) == "Hello, ..."
+
+    def test_default_length(self) -> None:
+        """The default limit is 80 characters including the '...' suffix."""
+        result = truncate_string("x" * 100)
+        assert len(result) == 80
+        assert result.endswith("...")
+
+    def test_custom_suffix(self) -> None:
+        """A custom suffix should be counted against max_length."""
+        assert truncate_string("abcdefghij", max_length=6, suffix="~") == "abcde~"
@@ -24,19 +24,38 @@ Usage:
 
 import argparse
 import os
+import re
 import subprocess
 import sys
+import tempfile
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import chain
 from pathlib import Path
 
 # Project root is one level up from the scripts/ directory
 PROJECT_DIR = Path(__file__).resolve().parent.parent
 
 
-def run_psql(query: str, json_output: bool = False) -> str:
-    """Execute a SQL query against the HedgeDoc database via docker compose exec.
+# Filename sanitizer: matches runs of anything that isn't an ASCII letter,
+# digit, '-', '_' or space. Compiled once at import; sub() strips each run in
+# a single native pass. ASCII-only on purpose — str.isalnum() also accepts
+# CJK/Arabic/etc. letters, which produce filenames many tools mishandle.
+_UNSAFE_TITLE_RE = re.compile(r"[^A-Za-z0-9\-_ ]+")
+
+
+def _psql_cmd(
+    json_output: bool = False, params: dict[str, str] | None = None
+) -> list[str]:
+    """Build the docker compose exec command that runs psql in the DB container.
 
     Uses psql inside the running database container so we don't need
     a local PostgreSQL client or network access to the container.
+
+    The SQL itself is sent on stdin (`-f -`), not via `-c`: psql only
+    substitutes `:'name'` / `:name` variables in scripts it reads, and
+    those variables are how user input reaches a query without being
+    pasted into the SQL text (which would allow SQL injection).
     """
     cmd = [
         "docker",
@@ -50,15 +69,29 @@ def run_psql(query: str, json_output: bool = False) -> str:
         "-d",
         os.environ.get("POSTGRES_DB", "hedgedoc"),
         "-t",  # Tuples only (no headers/footers)
+        "-v",
+        "ON_ERROR_STOP=1",  # Exit non-zero on SQL errors when reading a script
     ]
     if json_output:
         cmd.extend(["-A"])  # Unaligned output for cleaner parsing
 
-    cmd.extend(["-c", query])
+    # Each param becomes a psql variable: reference it as :'name' for a
+    # quoted string literal or :name for a bare value (e.g. a LIMIT)
+    for name, value in (params or {}).items():
+        cmd.extend(["-v", f"{name}={value}"])
+
+    cmd.extend(["-f", "-"])
+    return cmd
+
 
+def run_psql(
+    query: str, json_output: bool = False, params: dict[str, str] | None = None
+) -> str:
+    """Execute a SQL query against the HedgeDoc database via docker compose exec."""
     result = subprocess.run(
-        cmd,
+        _psql_cmd(json_output, params),
         cwd=str(PROJECT_DIR),
+        input=query,
         capture_output=True,
         text=True,
     )
@@ -68,6 +101,66 @@ def run_psql(query: str, json_output: bool = False) -> str:
     return result.stdout.strip()
 
 
+def run_psql_stream(
+    query: str, json_output: bool = False, params: dict[str, str] | None = None
+) -> Iterator[str]:
+    """Execute a SQL query and yield psql's output one line at a time.
+
+    Unlike run_psql(), psql's output is never held as one big string:
+    lines are parsed while psql is still producing them. Blank lines are
+    skipped.
+
+    stderr goes to a temp file rather than a pipe. Nothing reads a stderr
+    pipe until stdout hits EOF, so a chatty docker/psql could fill the pipe
+    buffer and block forever while we wait on stdout.
+    """
+    with tempfile.TemporaryFile(mode="w+") as stderr_file:
+        with subprocess.Popen(
+            _psql_cmd(json_output, params),
+            cwd=str(PROJECT_DIR),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            text=True,
+        ) as proc:
+            assert proc.stdin is not None and proc.stdout is not None
+            # The query is tiny, so writing it all before reading can't
+            # deadlock. If psql/docker dies before reading it (e.g. the stack
+            # is down), the write fails with EPIPE — ignore that and report
+            # via returncode below.
+            try:
+                proc.stdin.write(query)
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+            for line in proc.stdout:
+                line = line.rstrip("\n")
+                if line.strip():
+                    yield line
+
+        if proc.returncode != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().strip()
+            print(f"Database query failed: {stderr}", file=sys.stderr)
+            sys.exit(1)
+
+
+def _stream_rows(
+    sql: str, params: dict[str, str] | None = None
+) -> Iterator[str] | None:
+    """Stream a query's rows, or return None if it produced no rows.
+
+    Peeks at the first row so callers can print a "nothing found" message
+    before any header, then hands back an iterator that still yields every
+    row — the peeked one first — while psql keeps producing the rest.
+    """
+    rows = run_psql_stream(sql, params=params)
+    first = next(rows, None)
+    if first is None:
+        return None
+    return chain([first], rows)
+
+
 def run_docker_compose(args: list[str]) -> str:
     """Run a docker compose command and return stdout."""
     result = subprocess.run(
@@ -80,7 +173,12 @@ def run_docker_compose(args: list[str]) -> str:
 
 
 def load_env() -> None:
-    """Load .env file into os.environ for DB credential access."""
+    """Load .env file into os.environ for DB credential access.
+
+    Deliberately not cached to disk between runs: the file holds database
+    secrets that shouldn't be copied into ~/.cache, and parsing a few dozen
+    lines costs about the same as the stat + read a cache lookup would need.
+    """
     env_file = PROJECT_DIR / ".env"
     if not env_file.exists():
         print("ERROR: .env not found. Run 'make up' first.", file=sys.stderr)
@@ -116,7 +214,8 @@ def cmd_status(_args: argparse.Namespace) -> None:
     note_count = run_psql('SELECT COUNT(*) FROM "Notes";')
     user_count = run_psql('SELECT COUNT(*) FROM "Users";')
     db_size = run_psql(
-        f"SELECT pg_size_pretty(pg_database_size('{os.environ.get('POSTGRES_DB', 'hedgedoc')}'));"
+        "SELECT pg_size_pretty(pg_database_size(:'db'));",
+        params={"db": os.environ.get("POSTGRES_DB", "hedgedoc")},
     )
     print(f"  Notes: {note_count.strip()}")
     print(f"  Users: {user_count.strip()}")
@@ -152,7 +251,9 @@ def cmd_search(args: argparse.Namespace) -> None:
 
     # PostgreSQL full-text search with ts_rank for relevance ordering.
     # This searches both the title and the raw markdown content.
-    sql = f"""
+    # The search terms are bound as the psql variable :'q' — never
+    # interpolated into the SQL string — so quotes in the input are safe.
+    sql = """
         SELECT
             "shortid",
             COALESCE("title", '(untitled)') AS title,
@@ -161,23 +262,22 @@ def cmd_search(args: argparse.Namespace) -> None:
         FROM "Notes"
         WHERE
             to_tsvector('english', COALESCE("title", '') || ' ' || COALESCE("content", ''))
-            @@ plainto_tsquery('english', '{query}')
+            @@ plainto_tsquery('english', :'q')
         ORDER BY
             ts_rank(
                 to_tsvector('english', COALESCE("title", '') || ' ' || COALESCE("content", '')),
-                plainto_tsquery('english', '{query}')
+                plainto_tsquery('english', :'q')
             ) DESC
-        LIMIT {limit};
+        LIMIT :lim;
     """
-    results = run_psql(sql)
-
-    if not results:
+    rows = _stream_rows(sql, params={"q": query, "lim": str(limit)})
+    if rows is None:
         print(f"No notes matching '{query}'")
         return
 
     print(f"Search results for '{query}':")
     print("-" * 60)
-    for line in results.splitlines():
+    for line in rows:
         parts = [p.strip() for p in line.split("|")]
         if len(parts) >= 4:
             short_id, title, preview, updated = parts[0], parts[1], parts[2], parts[3]
@@ -204,13 +304,15 @@ def cmd_users(_args: argparse.Namespace) -> None:
         print("No registered users")
         return
 
-    print(f"{'ID':<6} {'Email':<30} {'Name':<20} {'Created'}")
-    print("-" * 80)
+    # Collect the whole table and write it once — one syscall instead of one
+    # print() per user, which adds up on a slow terminal or through `less`
+    rows = [f"{'ID':<6} {'Email':<30} {'Name':<20} {'Created'}", "-" * 80]
     for line in results.splitlines():
         parts = [p.strip() for p in line.split("|")]
         if len(parts) >= 4:
             uid, email, name, created = parts[0], parts[1], parts[2], parts[3]
-            print(f"{uid:<6} {email:<30} {name:<20} {created}")
+            rows.append(f"{uid:<6} {email:<30} {name:<20} {created}")
+    sys.stdout.write("\n".join(rows) + "\n")
 
 
 def cmd_create_user(args: argparse.Namespace) -> None:
@@ -251,7 +353,7 @@ def cmd_create_user(args: argparse.Namespace) -> None:
 def cmd_notes(args: argparse.Namespace) -> None:
     """List recent notes with titles and timestamps."""
     limit = args.limit
-    sql = f"""
+    sql = """
         SELECT
             "shortid",
             COALESCE("title", '(untitled)') AS title,
@@ -260,17 +362,17 @@ def cmd_notes(args: argparse.Namespace) -> None:
             "createdAt"
         FROM "Notes"
         ORDER BY "updatedAt" DESC
-        LIMIT {limit};
+        LIMIT :lim;
     """
-    results = run_psql(sql)
-
-    if not results:
+    rows = _stream_rows(sql, params={"lim": str(limit)})
+    if rows is None:
         print("No notes found")
         return
 
-    print(f"{'ID':<12} {'Title':<40} {'Chars':<8} {'Updated'}")
-    print("-" * 90)
-    for line in results.splitlines():
+    # Collect the table and write it once (bounded by --limit, so holding
+    # it in memory is fine) rather than one print() per note
+    table = [f"{'ID':<12} {'Title':<40} {'Chars':<8} {'Updated'}", "-" * 90]
+    for line in rows:
         parts = [p.strip() for p in line.split("|")]
         if len(parts) >= 5:
             short_id, title, chars, updated, _created = (
@@ -281,7 +383,20 @@ def cmd_notes(args: argparse.Namespace) -> None:
                 parts[4],
             )
             title_truncated = title[:38] + ".." if len(title) > 40 else title
-            print(f"{short_id:<12} {title_truncated:<40} {chars:<8} {updated}")
+            table.append(f"{short_id:<12} {title_truncated:<40} {chars:<8} {updated}")
+    sys.stdout.write("\n".join(table) + "\n")
+
+
+def _write_note(filepath: Path, content: str) -> None:
+    """Write a note's content plus a trailing newline to `filepath`.
+
+    Two write() calls instead of `content + "\\n"` avoid copying the whole
+    note into a temporary string; the file's buffer merges them into one
+    syscall anyway.
+    """
+    with open(filepath, "wb") as f:
+        f.write(content.encode())
+        f.write(b"\n")
 
 
 def cmd_export(args: argparse.Namespace) -> None:
@@ -294,39 +409,73 @@ def cmd_export(args: argparse.Namespace) -> None:
         FROM "Notes"
         ORDER BY "updatedAt" DESC;
     """
-    results = run_psql(sql)
-
-    if not results:
+    rows = _stream_rows(sql)
+    if rows is None:
         print("No notes to export")
         return
 
+    # File writes are I/O-bound, so a thread pool overlaps their latency
+    # (noticeable on network filesystems). Every filename embeds the note's
+    # unique shortid, so no two threads ever write the same file.
+    #
+    # The queue of pending writes is capped: if psql outruns the disk, we
+    # stop reading rows until some writes finish, so note contents never
+    # pile up in memory. Collecting finished writes as we go also surfaces a
+    # write error (disk full, permissions) early instead of after the last row.
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    max_pending = max_workers * 2
     count = 0
-    for line in results.splitlines():
-        parts = line.split("|", 2)
-        if len(parts) >= 3:
-            short_id = parts[0].strip()
-            title = parts[1].strip()
-            content = parts[2].strip()
-
-            # Sanitize the title for use as a filename
-            safe_title = "".join(c if c.isalnum() or c in "-_ " else "" for c in title)
-            safe_title = safe_title.strip().replace(" ", "-")[:60] or "untitled"
-            filename = f"{safe_title}-{short_id}.md"
-
-            filepath = output_dir / filename
-            filepath.write_text(content + "\n")
-            count += 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: set[Future[None]] = set()
+        for line in rows:
+            parts = line.split("|", 2)
+            if len(parts) >= 3:
+                short_id = parts[0].strip()
+                title = parts[1].strip()
+                content = parts[2].strip()
+
+                # Sanitize the title for use as a filename
+                safe_title = _UNSAFE_TITLE_RE.sub("", title)
+                safe_title = safe_title.strip().replace(" ", "-")[:60] or "untitled"
+                filename = f"{safe_title}-{short_id}.md"
+
+                filepath = output_dir / filename
+                pending.add(executor.submit(_write_note, filepath, content))
+                count += 1
+
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    # result() re-raises any write error here
+                    for future in done:
+                        future.result()
+
+        for future in pending:
+            future.result()
 
     print(f"Exported {count} notes to {output_dir}/")
 
 
 # -- CLI parser ---------------------------------------------------------------
 
+# Commands that take no arguments — main() dispatches these without argparse
+_NO_ARG_COMMANDS = {
+    "status": cmd_status,
+    "users": cmd_users,
+}
+
 
 def main() -> None:
     """Parse arguments and dispatch to the appropriate command."""
     load_env()
 
+    # Fast path: `status` and `users` take no arguments, so when either is
+    # run bare there is nothing to parse — skip building the parser and its
+    # six subparsers and dispatch straight away
+    if len(sys.argv) == 2 and sys.argv[1] in _NO_ARG_COMMANDS:
+        command = sys.argv[1]
+        _NO_ARG_COMMANDS[command](argparse.Namespace(command=command))
+        return
+
     parser = argparse.ArgumentParser(
         description="HedgeDoc management CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -3,10 +3,32 @@
 # =============================================================================
 # Exports the public API so consumers can do:
 #   from username_generator import generate_username, generate_batch
+#
+# The exports are resolved lazily via a module-level __getattr__ (PEP 562):
+# `import username_generator` (e.g. just to read __version__) doesn't load
+# core.py, the word lists, or the lookup tables built from them. The first
+# access to generate_username & co. imports core once; after that Python
+# finds the name directly and __getattr__ isn't called again.
 # =============================================================================
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-from username_generator.core import generate_batch, generate_username
+__all__ = ["generate_username", "generate_batch", "sample_example", "__version__"]
+
+# Names served from core.py on first access
+_LAZY_EXPORTS = frozenset({"generate_username", "generate_batch", "sample_example"})
+
+if TYPE_CHECKING:
+    from username_generator.core import generate_batch, generate_username, sample_example
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        from username_generator import core
 
-__all__ = ["generate_username", "generate_batch", "__version__"]
+        value = getattr(core, name)
+        globals()[name] = value  # Cache so later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
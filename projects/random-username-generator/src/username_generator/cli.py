@@ -13,13 +13,9 @@
 # =============================================================================
 
 import click
-from rich.console import Console
-from rich.table import Table
 
 from username_generator.config import PATTERNS, CaseStyle
-from username_generator.core import generate_batch, generate_username
-
-console = Console()
+from username_generator.core import generate_batch, generate_username, sample_example
 
 # Build a list of valid style names for Click's choice validation
 _STYLE_NAMES = [s.value for s in CaseStyle]
@@ -73,7 +69,9 @@ def main(
         username = generate_username(
             pattern=pattern, style=case_style, max_length=max_length, include=include
         )
-        console.print(f"[bold green]{username}[/bold green]")
+        # click.secho instead of Rich: one styled line doesn't need Rich's
+        # rendering pipeline, and skipping its import speeds up startup
+        click.secho(username, fg="green", bold=True)
     else:
         usernames = generate_batch(
             count,
@@ -83,21 +81,28 @@ def main(
             max_length=max_length,
             include=include,
         )
-        for name in usernames:
-            console.print(f"[bold green]{name}[/bold green]")
+        # Nothing generated (count < 1, or the word space ran out) — print
+        # nothing rather than the blank line an empty join would echo
+        if usernames:
+            click.echo("\n".join(click.style(name, fg="green", bold=True) for name in usernames))
 
 
 @main.command()
 def patterns() -> None:
     """List all available username patterns with examples."""
+    # Rich is only needed for this table, so it's imported here rather than
+    # at module top — the common `username-gen` path never loads it
+    from rich.console import Console
+    from rich.table import Table
+
     table = Table(title="Username Patterns", show_lines=True)
     table.add_column("Name", style="cyan", no_wrap=True)
     table.add_column("Template", style="yellow")
     table.add_column("Example", style="green")
 
     for name, template in sorted(PATTERNS.items()):
-        # Generate a live example for each pattern
-        example = generate_username(pattern=name, style=CaseStyle.PASCAL)
+        # Stable, cached example per pattern — same table on every run
+        example = sample_example(name)
         table.add_row(name, template, example)
 
-    console.print(table)
+    Console().print(table)
@@ -13,8 +13,12 @@
 # web API, Discord bot, or anywhere else without touching CLI code.
 # =============================================================================
 
+import bisect
+import functools
+import itertools
 import random
 import re
+from collections.abc import Callable, Sequence
 
 from username_generator.config import (
     MAX_NUMBER,
@@ -26,6 +30,113 @@ from username_generator.config import (
 )
 from username_generator.wordlists import ADJECTIVES, NOUNS, VERBS
 
+# The default RNG's methods bound to module-level names. Hot paths call
+# _choice(...) instead of random.choice(...), skipping an attribute lookup
+# on the random module each time. Same global RNG, so random.seed() works.
+_choice = random.choice
+_random = random.random
+_randrange = random.randrange
+
+# Matches one placeholder in a pattern template. Compiled once at import
+# instead of passing the pattern string to re.search() on every call.
+_PLACEHOLDER_RE = re.compile(r"\{(adj|noun|verb|num)\}")
+
+
+def _verbify(verb: str) -> str:
+    """Convert a base verb to an agent noun by adding 'er' suffix.
+
+    Handles English spelling rules:
+      - Silent 'e': gaze → gazer (not gazeer)
+      - Double consonant: run → runner, spin → spinner
+      - Default: jump → jumper
+
+    Not comprehensive (English is messy) but covers the verbs in our list.
+    """
+    if verb.endswith("e"):
+        return verb + "r"
+    # Double the final consonant for short CVC (consonant-vowel-consonant) verbs
+    if (
+        len(verb) >= 3
+        and verb[-1] not in "aeiouwy"
+        and verb[-2] in "aeiou"
+        and verb[-3] not in "aeiou"
+    ):
+        return verb + verb[-1] + "er"
+    return verb + "er"
+
+
+# Every verb's agent-noun form, computed once — _verbify is a pure function
+# over a fixed word list, so _fill_template can just pick from these tuples.
+_VERBS_ER = tuple(_verbify(v) for v in VERBS)
+_VERBS_ER_CAP = tuple(v.capitalize() for v in _VERBS_ER)
+
+
+# Word placeholder name → the tuple its words are drawn from. A dict lookup
+# replaces an if/elif chain in _fill_template's loop. {num} isn't here —
+# it's drawn from a range, not a list.
+_WORDS: dict[str, tuple[str, ...]] = {
+    "adj": ADJECTIVES,
+    "noun": NOUNS,
+    "verb": _VERBS_ER,
+}
+
+# Capitalized copies of the word lists, built once at import. PascalCase is
+# the default style, so drawing already-capitalized words lets those tokens
+# be joined as-is instead of running capitalize() on each one per username.
+_ADJECTIVES_CAP = tuple(w.capitalize() for w in ADJECTIVES)
+_NOUNS_CAP = tuple(w.capitalize() for w in NOUNS)
+
+_WORDS_PASCAL: dict[str, tuple[str, ...]] = {
+    "adj": _ADJECTIVES_CAP,
+    "noun": _NOUNS_CAP,
+    "verb": _VERBS_ER_CAP,
+}
+
+
+def _pascal_token(token: str) -> str:
+    """Case one token for PascalCase: words capitalized, anything else lowercased."""
+    return token.capitalize() if token.isalpha() else token.lower()
+
+
+def _parse_template(template: str) -> list[tuple[str | None, str]]:
+    """Split a template into a plan of (kind, literal) steps.
+
+    kind is a placeholder name ("adj", "noun", ...) with an empty literal,
+    or None for literal text between placeholders:
+        "the{adj}{noun}" → [(None, "the"), ("adj", ""), ("noun", "")]
+    """
+    plan: list[tuple[str | None, str]] = []
+    pos = 0
+    for match in _PLACEHOLDER_RE.finditer(template):
+        if match.start() > pos:
+            plan.append((None, template[pos : match.start()]))
+        plan.append((match.group(1), ""))
+        pos = match.end()
+    if pos < len(template):
+        plan.append((None, template[pos:]))
+    return plan
+
+
+# Pattern names and their running weight totals, for _pick_weighted_pattern.
+# PATTERN_WEIGHTS never changes, so the prefix sum is computed once here.
+_PATTERN_NAMES = tuple(PATTERN_WEIGHTS)
+_CUM_WEIGHTS = list(itertools.accumulate(PATTERN_WEIGHTS.values()))
+_TOTAL_WEIGHT = _CUM_WEIGHTS[-1]
+_LAST_PATTERN_INDEX = len(_PATTERN_NAMES) - 1
+
+# Every template parsed once at import. PATTERNS is fixed, so re-scanning
+# the same few template strings on every username was wasted work.
+_PLANS: dict[str, list[tuple[str | None, str]]] = {
+    name: _parse_template(template) for name, template in PATTERNS.items()
+}
+
+# Same plans with literal text pre-capitalized ("the" → "The"), paired
+# with _WORDS_PASCAL so PascalCase tokens come out ready to join
+_PLANS_PASCAL: dict[str, list[tuple[str | None, str]]] = {
+    name: [(kind, _pascal_token(literal) if kind is None else literal) for kind, literal in plan]
+    for name, plan in _PLANS.items()
+}
+
 
 def generate_username(
     *,
@@ -44,6 +155,11 @@ def generate_username(
                  random placeholder of matching type (alpha → noun slot,
                  numeric → num slot).
 
+    PascalCase is the one style not routed through _apply_style:
+    _fill_template pre-capitalizes its tokens (see _WORDS_PASCAL), so
+    they're joined as-is. _apply_style's PascalCase handler is for callers
+    passing plain lowercase tokens.
+
     Returns:
         A random username string.
 
@@ -56,15 +172,21 @@ def generate_username(
 
     # If include is a number, force a pattern that has {num} so it can be placed
     if include and include.isdigit() and not pattern:
-        pattern = random.choice([k for k, v in PATTERNS.items() if "{num}" in v])
+        pattern = _choice([k for k, v in PATTERNS.items() if "{num}" in v])
 
     # Retry loop — some word combos exceed max_length, so regenerate.
     # Bounded to prevent infinite loops on impossible constraints.
-    for _ in range(50):
+    # If a fixed pattern's shortest possible output is already too long,
+    # every retry is doomed — make one attempt and go straight to truncating.
+    attempts = 50
+    if pattern and not include and _MIN_LEN[pattern][style] > max_length:
+        attempts = 1
+
+    for _ in range(attempts):
         selected_pattern = pattern or _pick_weighted_pattern()
-        template = PATTERNS[selected_pattern]
-        tokens = _fill_template(template, include=include)
-        username = _apply_style(tokens, style)
+        tokens = _fill_template(selected_pattern, include=include, style=style)
+        # PascalCase tokens arrive already cased, so they only need joining
+        username = "".join(tokens) if style is CaseStyle.PASCAL else _apply_style(tokens, style)
 
         if len(username) <= max_length:
             return username
@@ -101,38 +223,101 @@ def generate_batch(
             for _ in range(count)
         ]
 
-    # Use a set for O(1) dedup lookups instead of checking a list each time
+    # Use a set for O(1) dedup lookups instead of checking a list each time.
+    # Every accepted name is in `seen`, so len(seen) doubles as the fill
+    # count: add() unconditionally and check whether the set grew — one hash
+    # operation per candidate instead of an `in` check plus an add().
     seen: set[str] = set()
-    results: list[str] = []
+    # Preallocated and filled by index, so the list never has to grow
+    results: list[str] = [""] * count
     # Cap iterations to avoid infinite loop if the word space is exhausted
     max_attempts = count * 10
 
     for _ in range(max_attempts):
-        if len(results) >= count:
+        filled = len(seen)
+        if filled >= count:
             break
         username = generate_username(
             pattern=pattern, style=style, max_length=max_length, include=include
         )
-        if username not in seen:
-            seen.add(username)
-            results.append(username)
+        seen.add(username)
+        if len(seen) > filled:
+            results[filled] = username
+
+    # Trim unused slots if the word space ran out before `count` names
+    return results[: len(seen)]
+
+
+@functools.cache
+def sample_example(pattern: str) -> str:
+    """Return a stable PascalCase example username for a pattern.
+
+    Uses its own random.Random seeded with the pattern name, so the same
+    pattern always gives the same example (handy for docs and the
+    `patterns` table) and the global RNG is left untouched. The result is
+    cached — after the first call it's a dict lookup.
+
+    Raises:
+        ValueError: If the pattern name doesn't exist.
+    """
+    if pattern not in PATTERNS:
+        valid = ", ".join(sorted(PATTERNS.keys()))
+        raise ValueError(f"Unknown pattern '{pattern}'. Valid patterns: {valid}")
+
+    rng = random.Random(pattern)
+
+    # Same bounded retry and truncating fallback as generate_username, so
+    # examples always fit the default limit
+    for _ in range(50):
+        username = "".join(_fill_template(pattern, style=CaseStyle.PASCAL, rng=rng))
+        if len(username) <= MAX_USERNAME_LENGTH:
+            return username
+    return username[:MAX_USERNAME_LENGTH]
 
-    return results
+
+def _min_length(pattern_name: str, style: CaseStyle) -> int:
+    """Length of the shortest username a pattern can produce in a style.
+
+    Sums the shortest word for each placeholder plus any literal text, and
+    adds one separator between tokens for snake_case/kebab-case.
+    """
+    shortest = {
+        "adj": min(map(len, ADJECTIVES)),
+        "noun": min(map(len, NOUNS)),
+        "verb": min(map(len, _VERBS_ER)),
+        "num": len(str(MIN_NUMBER)),
+    }
+    plan = _PLANS[pattern_name]
+    length = sum(len(literal) if kind is None else shortest[kind] for kind, literal in plan)
+    if style in (CaseStyle.SNAKE, CaseStyle.KEBAB):
+        length += len(plan) - 1
+    return length
 
 
 def _pick_weighted_pattern() -> str:
     """Select a random pattern name using configured weights.
 
-    Uses random.choices which implements weighted sampling via
-    cumulative distribution — O(n) setup, O(log n) per sample.
+    Weighted sampling via the cumulative distribution: scale one uniform
+    random number by the total weight and binary-search the precomputed
+    running totals — O(log n) per sample. This is what
+    random.choices(cum_weights=...) does internally, minus its argument
+    handling and the one-element list it builds for k=1; bisect runs in C.
+    Like random.choices, the search is capped at the last index, so a
+    product that rounds up to the total can't index past the end.
     """
-    names = list(PATTERN_WEIGHTS.keys())
-    weights = list(PATTERN_WEIGHTS.values())
-    return random.choices(names, weights=weights, k=1)[0]
+    return _PATTERN_NAMES[
+        bisect.bisect(_CUM_WEIGHTS, _random() * _TOTAL_WEIGHT, 0, _LAST_PATTERN_INDEX)
+    ]
 
 
-def _fill_template(template: str, *, include: str | None = None) -> list[str]:
-    """Replace placeholders in a pattern template with random words.
+def _fill_template(
+    pattern_name: str,
+    *,
+    include: str | None = None,
+    style: CaseStyle | None = None,
+    rng: random.Random | None = None,
+) -> list[str]:
+    """Replace placeholders in a pattern's template with random words.
 
     Returns a list of tokens (words and numbers) rather than a concatenated
     string. This preserves word boundaries so _apply_style can correctly
@@ -141,9 +326,20 @@ def _fill_template(template: str, *, include: str | None = None) -> list[str]:
     Literal text between placeholders (like "the" in "the{adj}{noun}")
     is preserved as its own token.
 
+    Works from the pattern's pre-parsed plan in _PLANS, so no template
+    string is scanned here — just a short loop over 2-4 steps.
+
     If `include` is provided, it replaces one placeholder of matching type:
       - Numeric string → replaces first {num} slot
       - Alphabetic string → replaces first {noun} slot (most natural position)
+
+    If `style` is PascalCase, every token comes back already capitalized
+    (drawn from _WORDS_PASCAL). Otherwise every token is lowercase —
+    word lists and template literals are lowercase by construction, and the
+    include word is lowercased here — which _apply_style relies on.
+
+    Draws from the global RNG unless `rng` is given; sample_example passes
+    its own seeded random.Random so its output is stable.
     """
     # Decide which placeholder type the include word should replace.
     # Numbers go into {num} slots; words go into {noun} slots since
@@ -153,38 +349,32 @@ def _fill_template(template: str, *, include: str | None = None) -> list[str]:
         include_target = "num" if include.isdigit() else "noun"
     include_used = False
 
-    tokens: list[str] = []
-    remainder = template
-
-    while remainder:
-        # Find the next placeholder
-        match = re.search(r"\{(adj|noun|verb|num)\}", remainder)
-        if not match:
-            # No more placeholders — remaining text is a literal token
-            if remainder:
-                tokens.append(remainder)
-            break
+    # Pick word sources and plan for the target style up front
+    if style is CaseStyle.PASCAL:
+        words, plan = _WORDS_PASCAL, _PLANS_PASCAL[pattern_name]
+        if include:
+            include = _pascal_token(include)
+    else:
+        words, plan = _WORDS, _PLANS[pattern_name]
+        if include:
+            include = include.lower()
 
-        # Capture any literal text before the placeholder as its own token
-        if match.start() > 0:
-            tokens.append(remainder[: match.start()])
+    choice, randrange = (rng.choice, rng.randrange) if rng else (_choice, _randrange)
 
-        # Replace the placeholder with a random word (or the include word)
-        placeholder = match.group(1)
+    tokens: list[str] = []
 
-        if not include_used and placeholder == include_target and include:
+    for kind, literal in plan:
+        if kind is None:
+            # Literal text from the template, kept as its own token
+            tokens.append(literal)
+        elif not include_used and kind == include_target and include:
             tokens.append(include)
             include_used = True
-        elif placeholder == "adj":
-            tokens.append(random.choice(ADJECTIVES))
-        elif placeholder == "noun":
-            tokens.append(random.choice(NOUNS))
-        elif placeholder == "verb":
-            tokens.append(_verbify(random.choice(VERBS)))
-        elif placeholder == "num":
-            tokens.append(str(random.randint(MIN_NUMBER, MAX_NUMBER)))
-
-        remainder = remainder[match.end() :]
+        elif kind == "num":
+            # randrange(a, b + 1) == randint(a, b), minus randint's extra call layer
+            tokens.append(str(randrange(MIN_NUMBER, MAX_NUMBER + 1)))
+        else:
+            tokens.append(choice(words[kind]))
 
     # If include wasn't placed (e.g., no matching slot), append it as a suffix
     if include and not include_used:
@@ -193,46 +383,51 @@ def _fill_template(template: str, *, include: str | None = None) -> list[str]:
     return tokens
 
 
-def _verbify(verb: str) -> str:
-    """Convert a base verb to an agent noun by adding 'er' suffix.
+# Shortest possible username per (pattern, style), from the fixed word lists.
+# Lets generate_username spot a max_length no combination can ever meet.
+_MIN_LEN: dict[str, dict[CaseStyle, int]] = {
+    name: {style: _min_length(name, style) for style in CaseStyle} for name in PATTERNS
+}
 
-    Handles English spelling rules:
-      - Silent 'e': gaze → gazer (not gazeer)
-      - Double consonant: run → runner, spin → spinner
-      - Default: jump → jumper
 
-    Not comprehensive (English is messy) but covers the verbs in our list.
-    """
-    if verb.endswith("e"):
-        return verb + "r"
-    # Double the final consonant for short CVC (consonant-vowel-consonant) verbs
-    if (
-        len(verb) >= 3
-        and verb[-1] not in "aeiouwy"
-        and verb[-2] in "aeiou"
-        and verb[-3] not in "aeiou"
-    ):
-        return verb + verb[-1] + "er"
-    return verb + "er"
+def _style_pascal(tokens: Sequence[str]) -> str:
+    return "".join(t.capitalize() if t.isalpha() else t for t in tokens)
+
+
+def _style_lower(tokens: Sequence[str]) -> str:
+    return "".join(tokens)
+
+
+def _style_upper(tokens: Sequence[str]) -> str:
+    return "".join(tokens).upper()
+
+
+def _style_snake(tokens: Sequence[str]) -> str:
+    return "_".join(tokens)
+
+
+def _style_kebab(tokens: Sequence[str]) -> str:
+    return "-".join(tokens)
+
+
+# CaseStyle → function that joins tokens in that style. One hash lookup per
+# call, where a match statement compares against each case in turn.
+_STYLE_HANDLERS: dict[CaseStyle, Callable[[Sequence[str]], str]] = {
+    CaseStyle.PASCAL: _style_pascal,
+    CaseStyle.LOWER: _style_lower,
+    CaseStyle.UPPER: _style_upper,
+    CaseStyle.SNAKE: _style_snake,
+    CaseStyle.KEBAB: _style_kebab,
+}
 
 
-def _apply_style(tokens: list[str], style: CaseStyle) -> str:
-    """Apply a casing style to a list of word/number tokens.
+def _apply_style(tokens: Sequence[str], style: CaseStyle) -> str:
+    """Apply a casing style to a sequence of word/number tokens.
 
     Receives pre-split tokens from _fill_template, so word boundaries
     are already known — no need to guess where words start and end.
+    Tokens must already be lowercase (_fill_template guarantees it), so
+    no normalizing pass is needed here. generate_username skips this for
+    PascalCase, asking _fill_template for pre-capitalized tokens instead.
     """
-    # Normalize all tokens to lowercase
-    tokens = [t.lower() for t in tokens]
-
-    match style:
-        case CaseStyle.PASCAL:
-            return "".join(t.capitalize() if t.isalpha() else t for t in tokens)
-        case CaseStyle.LOWER:
-            return "".join(tokens)
-        case CaseStyle.UPPER:
-            return "".join(tokens).upper()
-        case CaseStyle.SNAKE:
-            return "_".join(tokens)
-        case CaseStyle.KEBAB:
-            return "-".join(tokens)
+    return _STYLE_HANDLERS[style](tokens)